@@ -18,6 +18,8 @@ MYSQL_DB = {
 # URLs
 BASE_URL = "https://useinsider.com"
 CAREERS_URL = f"{BASE_URL}/careers"
+QA_CAREERS_URL = f"{CAREERS_URL}/quality-assurance/"
+QA_OPEN_POSITIONS_URL = f"{CAREERS_URL}/open-positions/?department=qualityassurance"
 
 # Browser settings
 BROWSER_OPTIONS = {
@@ -28,4 +30,80 @@ BROWSER_OPTIONS = {
         '--window-size=1920,1080'
     ],
     'firefox': []
-} 
\ No newline at end of file
+}
+
+# Event log settings
+EVENT_LOG = {
+    'path': 'logs/events.jsonl',  # Worker id is appended when running under xdist
+    'level': 'INFO',              # Minimum level written to the JSONL file
+    'buffer_size': 500,           # Events kept in memory per test for failure reports
+    'flush_interval': 1.0         # Seconds between background writes
+}
+
+# Remote WebDriver / Selenium Grid settings
+REMOTE_WEBDRIVER = {
+    'enabled': False,                      # Use Grid/standalone nodes instead of local browsers
+    'nodes': ['http://localhost:4444'],    # Grid hub or standalone server URLs
+    'max_sessions_per_node': 4,            # Concurrent sessions per node across all xdist workers
+    'pool_maxsize': 8,                     # Keep-alive HTTP connections per node
+    'session_retries': 3,                  # Attempts to create a session before failing
+    'retry_backoff': 2.0,                  # Base delay in seconds, doubled after each failed attempt
+    'slot_timeout': 300                    # Seconds to wait for a free session slot
+}
+
+# Offline analytics settings
+ANALYTICS = {
+    'export_path': 'analytics/results.npz',   # Columnar export read by the analyze command
+    'events_glob': 'logs/events*.jsonl',      # Step timings recorded by the event logger
+    'bucket_hours': 24,                       # Width of each trend bucket
+    'min_segment': 10,                        # Minimum runs on each side of a change point
+    'regression_increase': 0.2,               # Minimum relative mean increase to report
+    'regression_score': 5.0,                  # Minimum change-point t-score to report
+    'trends_table': 'ui_test_trends',
+    'regressions_table': 'ui_test_regressions'
+}
+
+
+# Pre-flight HTTP checks that gate the browser tier
+PREFLIGHT = {
+    'enabled': True,    # Skip browser tests when any page below is down or missing a marker
+    'timeout': 10,      # Seconds per request
+    'workers': 4,       # Concurrent requests sharing one connection pool
+    'pages': {
+        'home': {
+            'url': BASE_URL,
+            'ids': ['navbarNavDropdown', 'navbarDropdownMenuLink'],
+            'links': [],
+            'texts': []
+        },
+        'careers': {
+            'url': CAREERS_URL,
+            'ids': ['career-our-location', 'career-find-our-calling'],
+            'links': ['See all teams'],
+            'texts': ['Life at Insider']
+        },
+        'qa_careers': {
+            'url': QA_CAREERS_URL,
+            'ids': [],
+            'links': ['See all QA jobs'],
+            'texts': ['Quality Assurance']
+        },
+        'qa_open_positions': {
+            'url': QA_OPEN_POSITIONS_URL,
+            'ids': ['jobs-list'],
+            'links': [],
+            'texts': []
+        }
+    }
+}
+
+# Live run-progress metrics
+METRICS = {
+    'enabled': True,
+    'host': '127.0.0.1',
+    'port': 9464,                            # Prometheus endpoint on the controller, None to disable
+    'textfile': 'metrics/ui_tests.prom',     # node_exporter textfile, None to disable
+    'worker_dir': 'metrics/workers',         # Per-worker snapshots merged by the controller
+    'interval': 2.0,                         # Seconds between snapshot/textfile refreshes
+    'duration_buckets': [5, 10, 30, 60, 120, 300, 600]
+}
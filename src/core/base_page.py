@@ -3,6 +3,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from src.utils.event_logger import get_logger
+
 
 class BasePage:
     """
@@ -12,6 +14,7 @@ class BasePage:
     def __init__(self, driver, timeout=15):
         self.driver = driver
         self.wait = WebDriverWait(driver, timeout)
+        self.log = get_logger()
 
     def wait_for_element(self, by, locator, timeout=None):
         """
@@ -21,7 +24,7 @@ class BasePage:
             wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
             return wait.until(EC.presence_of_element_located((by, locator)))
         except TimeoutException:
-            print(f"Element not found: {locator}")
+            self.log.warning("Element not found", locator=locator)
             return None
 
     def wait_for_element_to_be_clickable(self, by, locator, timeout=None):
@@ -32,7 +35,7 @@ class BasePage:
             wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
             return wait.until(EC.element_to_be_clickable((by, locator)))
         except TimeoutException:
-            print(f"Element not clickable: {locator}")
+            self.log.warning("Element not clickable", locator=locator)
             return None
 
     def click_element(self, by, locator):
@@ -43,12 +46,12 @@ class BasePage:
         if element:
             try:
                 element.click()
-                print(f"Element activated: {locator}")
+                self.log.debug("Element activated", locator=locator)
             except Exception:
-                print(f"Using alternative click method for: {locator}")
+                self.log.info("Using alternative click method", locator=locator)
                 self.driver.execute_script("arguments[0].click();", element)
         else:
-            print(f"Unable to interact with element: {locator}")
+            self.log.warning("Unable to interact with element", locator=locator)
 
     def scroll_to_element(self, by, locator):
         """
@@ -57,24 +60,24 @@ class BasePage:
         element = self.wait_for_element(by, locator)
         if element:
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            print(f"Viewport adjusted to: {locator}")
+            self.log.debug("Viewport adjusted", locator=locator)
         else:
-            print(f"Cannot scroll to element: {locator}")
+            self.log.warning("Cannot scroll to element", locator=locator)
 
     def accept_cookies(self, cookie_xpath):
         """
         Clicks the cookie accept button if it's visible and clickable.
         """
         try:
-            print("Checking for cookie consent prompt...")
+            self.log.debug("Checking for cookie consent prompt...")
             cookie_button = self.wait_for_element_to_be_clickable(By.XPATH, cookie_xpath)
             if cookie_button:
                 cookie_button.click()
-                print("Cookie consent processed.")
+                self.log.info("Cookie consent processed.")
             else:
-                print("No cookie prompt detected.")
+                self.log.debug("No cookie prompt detected.")
         except NoSuchElementException:
-            print("Cookie consent not applicable.")
+            self.log.debug("Cookie consent not applicable.")
 
     def wait_for_page_to_load(self):
         """
@@ -82,9 +85,9 @@ class BasePage:
         """
         try:
             self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            print("Page rendering complete.")
+            self.log.debug("Page rendering complete.")
         except TimeoutException:
-            print("Page loading timed out.")
+            self.log.warning("Page loading timed out.")
 
     def get_element_text(self, by, locator):
         """
@@ -103,9 +106,9 @@ class BasePage:
             WebDriverWait(self.driver, timeout).until(
                 EC.text_to_be_present_in_element((by, locator), expected_text)
             )
-            print(f"Text value verified: '{expected_text}'")
+            self.log.debug("Text value verified", expected=expected_text)
             return True
         except TimeoutException:
             actual_text = self.get_element_text(by, locator)
-            print(f"Text mismatch - Expected: '{expected_text}', Found: '{actual_text}'")
+            self.log.warning("Text mismatch", expected=expected_text, found=actual_text)
             return False 
\ No newline at end of file
@@ -35,15 +35,14 @@ class CareersPage(BasePage):
             bool: True if title or URL contains career-related keywords, else False
         """
         try:
-            print("Assessing careers portal accessibility...")
+            self.log.debug("Assessing careers portal accessibility...")
             self.wait_for_page_to_load()
             title = self.driver.title.lower()
             url = self.driver.current_url.lower()
-            print(f"Page title: {title}")
-            print(f"Current address: {url}")
+            self.log.info("Careers page loaded", title=title, url=url)
             return "careers" in title or "quality assurance" in title or "/careers" in url
         except Exception as e:
-            print(f"Careers portal access verification issue: {e}")
+            self.log.error("Careers portal access verification issue", error=str(e))
             return False
 
     def verify_sections(self):
@@ -54,21 +53,21 @@ class CareersPage(BasePage):
             bool: True if all sections are found, else False
         """
         try:
-            print("Searching for Locations section...")
+            self.log.debug("Searching for Locations section...")
             self.wait_for_element(By.XPATH, self.locations_xpath)
-            print("Locations section identified.")
+            self.log.info("Locations section identified.")
 
-            print("Searching for Teams section...")
+            self.log.debug("Searching for Teams section...")
             self.wait_for_element(By.XPATH, self.teams_xpath)
-            print("Teams section identified.")
+            self.log.info("Teams section identified.")
 
-            print("Searching for Company Culture section...")
+            self.log.debug("Searching for Company Culture section...")
             self.wait_for_element(By.XPATH, self.life_at_insider_xpath)
-            print("Company Culture section identified.")
+            self.log.info("Company Culture section identified.")
 
             return True
         except Exception as e:
-            print(f"Section verification issue: {e}")
+            self.log.error("Section verification issue", error=str(e))
             return False
 
     def go_to_qa_careers(self):
@@ -76,7 +75,7 @@ class CareersPage(BasePage):
         Navigates to the QA Careers page, using fallback methods if necessary
         """
         try:
-            print("Locating the teams overview option...")
+            self.log.debug("Locating the teams overview option...")
             see_all_teams_button = self.wait_for_element_to_be_clickable(By.XPATH, self.see_all_teams_xpath)
 
             # Scroll twice with pause to ensure visibility
@@ -86,13 +85,13 @@ class CareersPage(BasePage):
             time.sleep(1)
 
             see_all_teams_button.click()
-            print("Teams overview selected.")
+            self.log.info("Teams overview selected.")
 
-            print("Allowing page content to load...")
+            self.log.debug("Allowing page content to load...")
             self.wait_for_page_to_load()
             time.sleep(2)
 
-            print("Finding Quality Assurance department...")
+            self.log.debug("Finding Quality Assurance department...")
             self.scroll_to_element(By.XPATH, self.qa_careers_xpath)
             time.sleep(1)
 
@@ -102,20 +101,20 @@ class CareersPage(BasePage):
             qa_open_link = self.wait_for_element_to_be_clickable(By.XPATH, self.qa_open_positions_xpath)
 
             if qa_open_link:
-                print("Selecting 'Open Positions' for QA team...")
+                self.log.info("Selecting 'Open Positions' for QA team...")
                 self.scroll_to_element(By.XPATH, self.qa_open_positions_xpath)
                 time.sleep(1)
                 qa_open_link.click()
-                print("QA career opportunities page loaded.")
+                self.log.info("QA career opportunities page loaded.")
             else:
                 # Fallback to clicking on the QA section title
-                print("Alternative navigation method required, attempting direct selection...")
+                self.log.warning("Alternative navigation method required, attempting direct selection...")
                 self.driver.execute_script("arguments[0].click();", qa_careers_section)
-                print("QA section selected (alternative method).")
+                self.log.info("QA section selected (alternative method).")
 
             # Verify we're on the right page by waiting for a QA jobs button
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'See all QA jobs')]"))
             )
         except Exception as e:
-            print(f"Navigation to QA department failed: {e}") 
\ No newline at end of file
+            self.log.error("Navigation to QA department failed", error=str(e)) 
\ No newline at end of file
@@ -36,14 +36,14 @@ class QACareersPage(BasePage):
             bool: True if accessible, False otherwise
         """
         try:
-            print("Examining QA careers page elements...")
+            self.log.debug("Examining QA careers page elements...")
             self.wait_for_page_to_load()
             self.wait_for_element(By.XPATH, self.view_role_button_xpath)
             current_url = self.driver.current_url
-            print("Currently at URL:", current_url)
+            self.log.info("QA careers page loaded", url=current_url)
             return "quality-assurance" in current_url.lower() or "qa" in current_url.lower()
         except Exception as e:
-            print(f"Problem identifying QA careers page: {e}")
+            self.log.error("Problem identifying QA careers page", error=str(e))
             return False
 
     def filter_jobs(self, location, department):
@@ -67,7 +67,7 @@ class QACareersPage(BasePage):
         If the department is 'Quality Assurance', selects 'Istanbul, Turkiye' from location filter.
         Retries up to 3 times if department is not loaded properly.
         """
-        print("Confirming department filter shows QA...")
+        self.log.debug("Confirming department filter shows QA...")
 
         for attempt in range(3):
             self.scroll_to_element(By.ID, self.department_container_id)
@@ -75,20 +75,20 @@ class QACareersPage(BasePage):
                                                        timeout=5)
 
             if success:
-                print("Department filter verified, selecting location...")
+                self.log.info("Department filter verified, selecting location...")
                 self.wait_for_job_cards_to_be_replaced()
                 self.click_element(By.ID, self.location_container_id)
-                print("Selecting Istanbul from location dropdown...")
+                self.log.debug("Selecting Istanbul from location dropdown...")
                 self.click_element(By.XPATH, self.location_istanbul_xpath)
-                print("Istanbul location selected successfully.")
-                print("Waiting for job listings to update...")
+                self.log.info("Istanbul location selected successfully.")
+                self.log.debug("Waiting for job listings to update...")
                 self.wait_for_element(By.XPATH, self.job_card_xpath)
                 return
             else:
-                print(f"Attempt {attempt + 1}: Department filter not set to 'Quality Assurance'. Retrying...")
+                self.log.warning("Department filter not set to 'Quality Assurance'. Retrying...", attempt=attempt + 1)
                 time.sleep(2)
 
-        print("Failed to set department filter to 'Quality Assurance'.")
+        self.log.error("Failed to set department filter to 'Quality Assurance'.")
 
     def wait_for_job_cards_to_load(self, timeout=15):
         """
@@ -97,25 +97,25 @@ class QACareersPage(BasePage):
         Args:
             timeout: Maximum wait time in seconds
         """
-        print("Awaiting job listing data to populate...")
+        self.log.debug("Awaiting job listing data to populate...")
         WebDriverWait(self.driver, timeout).until(
             EC.presence_of_element_located((By.XPATH, self.job_list_xpath))
         )
-        print("Job listings data received.")
+        self.log.info("Job listings data received.")
 
     def wait_for_job_cards_to_be_replaced(self):
         """
         Waits until old job cards are replaced with new ones
         """
         try:
-            print("Monitoring for listing refresh...")
+            self.log.debug("Monitoring for listing refresh...")
             self.wait.until(EC.invisibility_of_element_located((By.XPATH, self.job_card_xpath)))
-            print("Previous listings cleared.")
+            self.log.debug("Previous listings cleared.")
         except:
-            print("Previous listings state unclear. Proceeding anyway...")
+            self.log.warning("Previous listings state unclear. Proceeding anyway...")
 
         self.wait.until(lambda d: len(d.find_elements(By.XPATH, self.job_card_xpath)) > 0)
-        print("New listing data rendered.")
+        self.log.debug("New listing data rendered.")
 
     def verify_job_listings(self):
         """
@@ -124,7 +124,7 @@ class QACareersPage(BasePage):
         Returns:
             bool: True if valid jobs exist, False otherwise
         """
-        print("Looking for QA positions in Istanbul...")
+        self.log.info("Looking for QA positions in Istanbul...")
         time.sleep(10)
 
         job_texts = self.driver.execute_script("""
@@ -133,15 +133,14 @@ class QACareersPage(BasePage):
 
         valid_jobs = 0
         for i, text in enumerate(job_texts, 1):
-            print(f"Listing {i}:\n{text}\n")
             lower_text = text.lower()
-            if "quality assurance" in lower_text and "istanbul" in lower_text:
-                print(f"Listing {i} MATCHES criteria: QA position in Istanbul")
+            matches = "quality assurance" in lower_text and "istanbul" in lower_text
+            # Full listing text is only kept in the buffer for failure reports
+            self.log.debug("Job listing inspected", listing=i, matches=matches, text=text)
+            if matches:
                 valid_jobs += 1
-            else:
-                print(f"Listing {i} does NOT match criteria")
 
-        print(f"Found {valid_jobs} matching positions")
+        self.log.info("Job listings verified", total=len(job_texts), matching=valid_jobs)
         return valid_jobs > 0
 
     def verify_view_role_redirects(self):
@@ -151,10 +150,10 @@ class QACareersPage(BasePage):
         Returns:
             bool: True if redirected to lever.co, else False
         """
-        print("Locating job details link...")
+        self.log.debug("Locating job details link...")
         try:
             self.wait_for_element(By.XPATH, self.job_card_xpath, timeout=15)
-            print("Job listings located.")
+            self.log.debug("Job listings located.")
 
             for attempt in range(3):
                 try:
@@ -166,48 +165,48 @@ class QACareersPage(BasePage):
 
                         try:
                             view_role_button.click()
-                            print("Job details link activated.")
+                            self.log.info("Job details link activated.")
                         except Exception as e:
-                            print(f"Standard click method failed: {e}, trying JavaScript alternative.")
+                            self.log.warning("Standard click method failed, trying JavaScript alternative.", error=str(e))
                             self.driver.execute_script("arguments[0].click();", view_role_button)
 
                         break
                     else:
-                        print("Job details link not found.")
+                        self.log.error("Job details link not found.")
                         return False
 
                 except Exception as e:
-                    print(f"Attempt {attempt + 1} unsuccessful: {e}")
+                    self.log.warning("View Role attempt unsuccessful", attempt=attempt + 1, error=str(e))
                     time.sleep(1)
 
             # Check if new tab was opened
             windows = self.driver.window_handles
             if len(windows) > 1:
                 self.driver.switch_to.window(windows[1])
-                print("Switched to job details tab:", self.driver.current_url)
+                self.log.info("Switched to job details tab", url=self.driver.current_url)
 
             self.wait_for_page_to_load()
             return "lever.co" in self.driver.current_url
 
         except Exception as e:
-            print(f"Job details link verification error: {e}")
+            self.log.error("Job details link verification error", error=str(e))
             return False
 
     def click_see_all_qa_jobs(self):
         """
         Clicks on the 'See all QA jobs' button
         """
-        print("Searching for 'See all QA jobs' option...")
+        self.log.debug("Searching for 'See all QA jobs' option...")
         button = self.wait_for_element_to_be_clickable(By.XPATH, self.see_all_qa_jobs_xpath)
         if button:
-            print("'See all QA jobs' button detected, activating...")
+            self.log.info("'See all QA jobs' button detected, activating...")
             button.click()
         else:
-            print("Primary button not found, searching for alternatives...")
+            self.log.warning("Primary button not found, searching for alternatives...")
             # Try JavaScript click as fallback
             all_buttons = self.driver.find_elements(By.XPATH, "//a[contains(text(), 'jobs')]")
             for btn in all_buttons:
                 if "qa" in btn.text.lower() or "quality" in btn.text.lower():
-                    print("Alternative QA job button located, using JavaScript click.")
+                    self.log.info("Alternative QA job button located, using JavaScript click.")
                     self.driver.execute_script("arguments[0].click();", btn)
                     break 
\ No newline at end of file
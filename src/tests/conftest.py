@@ -9,8 +9,44 @@ from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
-from src.utils.db_controller import insert_test_result_to_mysql
-from src.config.config import BROWSER_OPTIONS, RETRY_ATTEMPTS
+from src.utils.db_controller import get_result_sink
+from src.utils.event_logger import get_logger
+from src.utils.remote_driver import RemoteDriverPool
+from src.utils.preflight import run_preflight
+from src.utils.run_metrics import MetricsExporter, get_metrics
+from src.config.config import BROWSER_OPTIONS, RETRY_ATTEMPTS, REMOTE_WEBDRIVER, PREFLIGHT, METRICS
+
+
+@pytest.fixture(scope="session")
+def preflight():
+    """
+    Runs the HTTP pre-flight checks once per session (once per xdist worker).
+
+    Returns:
+        dict: page name -> PreflightResult
+    """
+    return run_preflight(PREFLIGHT['pages'], timeout=PREFLIGHT['timeout'], workers=PREFLIGHT['workers'])
+
+
+@pytest.fixture(scope="session")
+def remote_pool():
+    """
+    Session-wide pool of keep-alive connections to the Selenium Grid nodes
+    configured in REMOTE_WEBDRIVER.
+
+    Returns:
+        RemoteDriverPool: pool used to create and release remote sessions
+    """
+    pool = RemoteDriverPool(
+        nodes=REMOTE_WEBDRIVER['nodes'],
+        max_sessions_per_node=REMOTE_WEBDRIVER['max_sessions_per_node'],
+        pool_maxsize=REMOTE_WEBDRIVER['pool_maxsize'],
+        session_retries=REMOTE_WEBDRIVER['session_retries'],
+        retry_backoff=REMOTE_WEBDRIVER['retry_backoff'],
+        slot_timeout=REMOTE_WEBDRIVER['slot_timeout']
+    )
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(params=["chrome", "firefox"])
@@ -18,6 +54,8 @@ def driver(request):
     """
     Fixture to provide WebDriver instances for Chrome and Firefox.
     The test will run for each browser defined in the params.
+    When REMOTE_WEBDRIVER is enabled the sessions run on Selenium Grid nodes.
+    The test is skipped without launching a browser if the pre-flight tier failed.
     
     Args:
         request: pytest request object
@@ -25,13 +63,44 @@ def driver(request):
     Returns:
         WebDriver: configured browser driver instance
     """
+    log = get_logger()
+    log.bind(browser=request.param)
+
+    if PREFLIGHT['enabled']:
+        failures = [result.describe() for result in request.getfixturevalue("preflight").values()
+                    if not result.passed]
+        if failures:
+            pytest.skip("Pre-flight HTTP checks failed, browser not launched: " + "; ".join(failures))
+
+    if REMOTE_WEBDRIVER['enabled']:
+        pool = request.getfixturevalue("remote_pool")
+        options = ChromeOptions() if request.param == "chrome" else FirefoxOptions()
+        for argument in BROWSER_OPTIONS[request.param]:
+            options.add_argument(argument)
+        try:
+            driver = pool.create_driver(options)
+        except Exception as e:
+            log.error("Failed to initialize remote browser", error=str(e))
+            raise
+
+        # From here on the session holds a node slot, so every failure must release it
+        get_metrics().browser_started()
+        try:
+            driver.implicitly_wait(5)
+            driver.maximize_window()
+            yield driver
+        finally:
+            pool.release(driver)
+            get_metrics().browser_stopped()
+        return
+
     if request.param == "chrome":
         try:
             driver = webdriver.Chrome()
             driver.implicitly_wait(5)
-            print("Chrome driver initialized successfully")
+            log.info("Chrome driver initialized successfully")
         except Exception as e:
-            print(f"Failed to initialize Chrome: {e}")
+            log.error("Failed to initialize Chrome", error=str(e))
             raise
 
     elif request.param == "firefox":
@@ -39,22 +108,27 @@ def driver(request):
             firefox_options = FirefoxOptions()
             driver = webdriver.Firefox(options=firefox_options)
             driver.implicitly_wait(5)
-            print("Firefox driver initialized successfully")
+            log.info("Firefox driver initialized successfully")
         except Exception as e:
-            print(f"Failed to initialize Firefox: {e}")
+            log.error("Failed to initialize Firefox", error=str(e))
             raise
 
-    driver.maximize_window()
-    yield driver
-    driver.quit()
+    get_metrics().browser_started()
+    try:
+        driver.maximize_window()
+        yield driver
+    finally:
+        driver.quit()
+        get_metrics().browser_stopped()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
     Pytest hook to handle test result reporting:
-    - Inserts test result to MySQL database
-    - Captures screenshot on test failure
+    - Queues browser test results for the MySQL result sink
+    - Captures screenshot on browser test failure
+    - Attaches the buffered event log to failed reports only
     
     Args:
         item: pytest test item
@@ -63,23 +137,23 @@ def pytest_runtest_makereport(item, call):
     # Get the test result
     outcome = yield
     report = outcome.get_result()
+    log = get_logger()
 
-    # Only record results during the test execution phase
-    if report.when == "call":
+    # Only record browser test results during the test execution phase;
+    # pre-flight and unit tests would skew the dashboard's pass rate and browser panels
+    if report.when == "call" and "driver" in item.funcargs:
         test_name = item.name
         status = "passed" if report.passed else "failed"
         duration = report.duration
 
-        # Write results to MySQL database
-        try:
-            insert_test_result_to_mysql(
-                test_name=test_name,
-                status=status,
-                duration=duration
-            )
-            print(f"📊 Test result saved to mysql-qa database: {test_name} | {status} | {duration:.2f}s")
-        except Exception as e:
-            print(f"Failed to save test result to database: {e}")
+        # Write results to MySQL database in the background
+        get_result_sink().submit(
+            test_name=test_name,
+            status=status,
+            duration=duration,
+            timestamp=datetime.utcnow()
+        )
+        log.info("Test result queued for mysql-qa database", status=status, duration=round(duration, 2))
 
         # If the test fails, take a screenshot
         if report.failed:
@@ -89,20 +163,93 @@ def pytest_runtest_makereport(item, call):
                     os.makedirs(screenshot_dir)
                 screenshot_path = os.path.join(screenshot_dir, f"{test_name}.png")
                 item.funcargs["driver"].save_screenshot(screenshot_path)
-                print(f"🖼 Screenshot captured: {screenshot_path}")
+                log.info("Screenshot captured", path=screenshot_path)
             except Exception as e:
-                print(f"Failed to capture screenshot: {e}")
+                log.error("Failed to capture screenshot", error=str(e))
+
+    # Passing tests stay quiet; failed phases get the full buffered detail, if there is any
+    if report.failed:
+        events = log.snapshot()
+        if events:
+            report.sections.append(("Event log", log.format_events(events)))
+    if report.when == "teardown":
+        log.drain()
+        log.bind(test=None, browser=None, step=None)
 
 
 # Configure retry for flaky tests
 def pytest_configure(config):
-    """Configure pytest with retry plugin if available"""
+    """Configure pytest with retry plugin if available and start live metrics"""
     config.addinivalue_line(
         "markers", "flaky: mark test as flaky, will be retried"
     )
 
+    if not METRICS['enabled']:
+        return
+    is_worker = hasattr(config, "workerinput")
+    is_distributed = bool(getattr(config.option, "numprocesses", None))
+
+    # The controller (or a plain run) merges all worker snapshots
+    if not is_worker:
+        config.metrics_exporter = MetricsExporter(
+            snapshot_dir=METRICS['worker_dir'],
+            host=METRICS['host'],
+            port=METRICS['port'],
+            textfile=METRICS['textfile'],
+            interval=METRICS['interval']
+        )
+        config.metrics_exporter.start()
+
+    # Every process that runs tests publishes its own snapshot
+    if is_worker or not is_distributed:
+        metrics = get_metrics()
+        metrics.gauge_sources['result_sink_queue_depth'] = get_result_sink().pending
+        metrics.start()
+        config.run_metrics = metrics
+
+
+def pytest_unconfigure(config):
+    """Write final metric snapshots, stop the exporter and flush the event log last"""
+    if hasattr(config, "run_metrics"):
+        config.run_metrics.stop()
+    if hasattr(config, "metrics_exporter"):
+        config.metrics_exporter.stop()
+    get_logger().close()
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Run the HTTP pre-flight tier before any browser test"""
+    items.sort(key=lambda item: item.get_closest_marker("preflight") is None)
+
 
 @pytest.hookimpl(trylast=True)
 def pytest_runtest_setup(item):
     """Apply retry marker to all tests"""
-    item.add_marker(pytest.mark.flaky(reruns=RETRY_ATTEMPTS)) 
\ No newline at end of file
+    item.add_marker(pytest.mark.flaky(reruns=RETRY_ATTEMPTS))
+
+
+_test_browsers = {}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Count the test as started; reruns of the same item are counted separately"""
+    callspec = getattr(item, "callspec", None)
+    browser = callspec.params.get("driver", "none") if callspec else "none"
+    _test_browsers[item.nodeid] = browser
+    get_metrics().increment('started', browser)
+
+
+def pytest_runtest_logreport(report):
+    """Update live pass/fail/skip/rerun counters and the duration histogram"""
+    get_metrics().record_report(report, _test_browsers.get(report.nodeid, "none"))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Tag every event of the upcoming test (including fixture setup) with its id"""
+    get_logger().bind(test=nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Flush queued results to MySQL before the session exits"""
+    get_result_sink().close()
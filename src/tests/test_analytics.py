@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from src.config.config import ANALYTICS
+from src.utils.analytics import _analyze_dataset, bucket_statistics, change_point, detect_regressions, parse_results
+
+
+DAY = 86400
+
+
+def test_bucket_percentiles_match_numpy():
+    rng = np.random.default_rng(7)
+    size = 20000
+    ts = rng.integers(0, DAY * 10, size)
+    duration = rng.gamma(4, 10, size)
+    failed = rng.random(size) < 0.1
+    group = rng.integers(0, 6, size).astype(np.int32)
+
+    stats = bucket_statistics(ts, duration, failed, group, DAY)
+
+    assert stats['runs'].sum() == size
+    for i in range(len(stats['runs'])):
+        rows = (group == stats['group'][i]) & (ts // DAY * DAY == stats['bucket_start'][i])
+        assert rows.sum() == stats['runs'][i]
+        expected = np.percentile(duration[rows], [50, 95, 99])
+        assert np.allclose(expected, [stats['p50'][i], stats['p95'][i], stats['p99'][i]])
+        assert np.isclose(failed[rows].mean(), stats['failure_rate'][i])
+
+
+def test_change_point_finds_step_and_ignores_flat_series():
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.normal(30, 1, 60), rng.normal(45, 1, 40)])
+
+    split, score, before, after = change_point(values, min_segment=10)
+
+    assert split == 60
+    assert score > ANALYTICS['regression_score']
+    assert before == pytest.approx(30, abs=1) and after == pytest.approx(45, abs=1)
+
+    flat = rng.normal(30, 1, 100)
+    ts = np.arange(200)
+    duration = np.concatenate([flat, values])
+    group = np.repeat([0, 1], 100).astype(np.int32)
+    regressions = detect_regressions(ts, duration, group, 10, ANALYTICS['regression_increase'],
+                                     ANALYTICS['regression_score'])
+    assert [(r['group'], r['change_at']) for r in regressions] == [(1, 160)]
+
+
+def test_change_point_needs_two_full_segments():
+    assert change_point(np.ones(19), min_segment=10) is None
+
+
+def test_labels_round_trip_through_parse_and_analysis():
+    rows = [
+        ("test_login[chrome]", "passed", 10.0, 1000),
+        ("test_login[firefox]", "failed", 20.0, 1000),
+        ("test_search[chrome]", "passed", 30.0, 2000),
+        ("test_search[chrome]", "failed", 50.0, 2100),
+        ("test_api", "passed", 1.5, 3000)
+    ]
+    raw = "".join(f"{name}\t{status}\t{duration}\t{ts}\n" for name, status, duration, ts in rows).encode()
+
+    columns = parse_results(raw)
+    # Tiny chunks split the buffer between rows without changing the result
+    chunked = parse_results(raw, chunk_bytes=8)
+    assert all(np.array_equal(columns[key], chunked[key]) for key in columns)
+
+    test_names = columns['test_names']
+    browser_names = columns['browser_names']
+    trends, _ = _analyze_dataset(
+        columns['ts'], columns['duration'], columns['failed'],
+        [columns['test'], columns['browser']],
+        lambda row: (str(test_names[row[0]]), str(browser_names[row[1]]), ""),
+        dict(ANALYTICS, bucket_hours=24)
+    )
+
+    by_label = {trend[:3]: trend for trend in trends}
+    assert set(by_label) == {
+        ("test_login", "chrome", ""), ("test_login", "firefox", ""),
+        ("test_search", "chrome", ""), ("test_api", "unknown", "")
+    }
+    _, _, _, _, runs, p50, _, _, failure_rate = by_label[("test_search", "chrome", "")]
+    assert (runs, p50, failure_rate) == (2, 40.0, 0.5)
+    assert by_label[("test_login", "firefox", "")][8] == 1.0
+
+
+def test_parse_results_rejects_malformed_rows():
+    with pytest.raises(ValueError):
+        parse_results(b"test_a[chrome]\tpassed\t1.0\n")
+    assert parse_results(b"") is None
@@ -0,0 +1,127 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+from src.utils import db_controller, event_logger
+from src.utils.event_logger import EventLogger
+
+
+def read_events(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def logger(tmp_path):
+    """
+    EventLogger writing to a temporary JSONL file
+    """
+    log = EventLogger(str(tmp_path / "logs" / "events.jsonl"), level='INFO', buffer_size=100, flush_interval=0.05)
+    yield log
+    log.close()
+
+
+def test_debug_events_are_buffered_but_not_written(logger):
+    logger.debug("detail", listing=1)
+    logger.info("summary")
+    logger.close()
+
+    assert [e['msg'] for e in logger.snapshot()] == ["detail", "summary"]
+    assert [e['msg'] for e in read_events(logger.path)] == ["summary"]
+
+
+def test_ring_buffer_keeps_latest_events(tmp_path):
+    logger = EventLogger(str(tmp_path / "events.jsonl"), buffer_size=5)
+    try:
+        for i in range(8):
+            logger.debug(f"event {i}")
+
+        assert [e['msg'] for e in logger.snapshot()] == [f"event {i}" for i in range(3, 8)]
+        assert len(logger.drain()) == 5
+        assert logger.snapshot() == []
+    finally:
+        logger.close()
+
+
+def test_step_restores_context_after_failure(logger):
+    logger.bind(test="test_a", browser="chrome")
+    with logger.step("outer"):
+        with pytest.raises(AssertionError):
+            with logger.step("inner"):
+                assert False, "boom"
+        logger.info("after inner")
+    logger.info("after outer")
+
+    events = logger.snapshot()
+    failed = next(e for e in events if e['msg'] == "Step failed: inner")
+    assert failed['lvl'] == 'ERROR' and failed['error'].startswith("boom")
+    assert next(e for e in events if e['msg'] == "after inner")['step'] == "outer"
+    assert 'step' not in next(e for e in events if e['msg'] == "after outer")
+    assert all(e['test'] == "test_a" and e['browser'] == "chrome" for e in events)
+
+
+def test_step_skip_is_not_logged_as_failure(logger):
+    with pytest.raises(pytest.skip.Exception):
+        with logger.step("skipped"):
+            pytest.skip("not applicable")
+
+    stopped = logger.snapshot()[-1]
+    assert stopped['msg'] == "Step stopped: skipped"
+    assert stopped['lvl'] == 'INFO' and stopped['outcome'] == "Skipped"
+
+
+def test_close_flushes_pending_events_and_late_events_are_written(logger):
+    for i in range(3):
+        logger.warning("queued", index=i)
+    logger.close()
+    logger.error("after close")
+
+    events = read_events(logger.path)
+    assert [e['msg'] for e in events] == ["queued"] * 3 + ["after close"]
+    assert len({e['run'] for e in events}) == 1
+
+
+def test_detached_events_use_given_context_and_skip_buffer(logger):
+    logger.bind(test="test_b", browser="firefox")
+    logger.log_detached({'test': "test_a"}, 'ERROR', "late failure", error="x")
+    logger.close()
+
+    assert logger.snapshot() == []
+    [event] = read_events(logger.path)
+    assert event['test'] == "test_a" and 'browser' not in event
+
+
+def test_result_sink_logs_with_submitting_test_context(logger, monkeypatch):
+    monkeypatch.setattr(event_logger, "_logger", logger)
+
+    def unavailable(*args, **kwargs):
+        raise OSError("docker not available")
+
+    monkeypatch.setattr(db_controller.subprocess, "Popen", unavailable)
+    sink = db_controller.ResultSink()
+    logger.bind(test="test_a", browser="chrome")
+    sink.submit("test_a", "passed", 1.0, datetime.utcnow())
+    # The next test is already bound while the insert runs in the background
+    logger.bind(test="test_b", browser="firefox")
+    sink.close()
+    logger.close()
+
+    assert logger.snapshot() == []
+    [event] = [e for e in read_events(logger.path) if e['msg'] == "Error saving test result"]
+    assert event['test'] == "test_a" and event['browser'] == "chrome"
+
+
+def test_get_logger_uses_worker_specific_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_logger, "_logger", None)
+    monkeypatch.setitem(event_logger.EVENT_LOG, 'path', str(tmp_path / "events.jsonl"))
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run42")
+
+    log = event_logger.get_logger()
+    try:
+        assert log is event_logger.get_logger()
+        assert log.path == os.path.join(str(tmp_path), "events-gw3.jsonl")
+        assert log.run_id == "run42"
+    finally:
+        log.close()
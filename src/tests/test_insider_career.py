@@ -3,6 +3,7 @@ from src.pages.home_page import HomePage
 from src.pages.careers_page import CareersPage
 from src.pages.qa_careers_page import QACareersPage
 from src.config.config import BASE_URL
+from src.utils.event_logger import get_logger
 
 
 @pytest.mark.smoke
@@ -15,53 +16,54 @@ def test_insider_career_page(driver):
     Args:
         driver: WebDriver instance provided by the fixture
     """
+    log = get_logger()
+
     # Step 1: Navigate to Insider home page
-    print("Starting test sequence: Opening Insider website...")
-    home_page = HomePage(driver)
-    home_page.go_to_insider_home_page()
-    assert home_page.is_accessible(), "Unable to access Insider homepage!"
+    with log.step("Open Insider website"):
+        home_page = HomePage(driver)
+        home_page.go_to_insider_home_page()
+        assert home_page.is_accessible(), "Unable to access Insider homepage!"
 
     # Step 2: Accept cookies if present
-    print("Handling cookie consent dialog...")
-    home_page.accept_cookies()
+    with log.step("Handle cookie consent"):
+        home_page.accept_cookies()
 
     # Step 3: Navigate to Careers page
-    print("Proceeding to careers section...")
-    home_page.navigate_to_careers()
-    careers_page = CareersPage(driver)
-    assert careers_page.is_accessible(), "Cannot access the careers portal!"
+    with log.step("Open careers page"):
+        home_page.navigate_to_careers()
+        careers_page = CareersPage(driver)
+        assert careers_page.is_accessible(), "Cannot access the careers portal!"
 
     # Step 4: Verify required sections on Careers page
-    print("Validating careers page structure...")
-    assert careers_page.verify_sections(), "Required content sections missing from careers page!"
+    with log.step("Validate careers page sections"):
+        assert careers_page.verify_sections(), "Required content sections missing from careers page!"
 
     # Step 5: Navigate to QA Careers page
-    print("Navigating to Quality Assurance positions...")
-    careers_page.go_to_qa_careers()
-    qa_careers_page = QACareersPage(driver)
+    with log.step("Navigate to QA careers"):
+        careers_page.go_to_qa_careers()
+        qa_careers_page = QACareersPage(driver)
 
     # Step 6: Verify QA Careers page accessibility
-    print("Verifying QA careers section accessibility...")
-    assert qa_careers_page.is_accessible(), "QA careers section inaccessible!"
+    with log.step("Verify QA careers page"):
+        assert qa_careers_page.is_accessible(), "QA careers section inaccessible!"
 
     # Step 7: Click "See all QA jobs" button
-    print("Expanding to view all QA positions...")
-    qa_careers_page.click_see_all_qa_jobs()
+    with log.step("See all QA jobs"):
+        qa_careers_page.click_see_all_qa_jobs()
 
     # Step 8: Filter jobs for Istanbul location if department is Quality Assurance
-    print("Filtering for Istanbul-based QA positions...")
-    qa_careers_page.select_location_if_department_is_qa()
-    qa_careers_page.wait_for_job_cards_to_be_replaced()
+    with log.step("Filter Istanbul QA positions"):
+        qa_careers_page.select_location_if_department_is_qa()
+        qa_careers_page.wait_for_job_cards_to_be_replaced()
 
     # Step 9: Verify job listings contain both QA and Istanbul
-    qa_careers_page.wait_for_job_cards_to_load()
-    print("Analyzing job listings for relevance...")
-    assert qa_careers_page.verify_job_listings(), "No matching QA positions found in Istanbul!"
+    with log.step("Verify job listings"):
+        qa_careers_page.wait_for_job_cards_to_load()
+        assert qa_careers_page.verify_job_listings(), "No matching QA positions found in Istanbul!"
 
     # Step 10: Verify View Role button redirects correctly
-    print("Testing job details link functionality...")
-    assert qa_careers_page.verify_view_role_redirects(), "Job details link redirection failed!"
+    with log.step("Verify View Role redirect"):
+        assert qa_careers_page.verify_view_role_redirects(), "Job details link redirection failed!"
 
     # Test completed successfully
-    print("Test automation sequence completed successfully!")
-    print("Final destination:", driver.current_url) 
\ No newline at end of file
+    log.info("Test automation sequence completed successfully!", url=driver.current_url)
@@ -0,0 +1,19 @@
+import pytest
+from src.config.config import PREFLIGHT
+
+
+@pytest.mark.smoke
+@pytest.mark.preflight
+@pytest.mark.parametrize("page_name", list(PREFLIGHT['pages']))
+def test_page_preflight(preflight, page_name):
+    """
+    Pre-flight tier: each page is reachable over plain HTTP and contains the markers
+    the page objects rely on. Failures here skip the browser tier.
+
+    Args:
+        preflight: Results of the session-wide pre-flight run
+        page_name: Key of the page in PREFLIGHT['pages']
+    """
+    result = preflight[page_name]
+    assert result.passed, result.describe()
+
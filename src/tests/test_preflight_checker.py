@@ -0,0 +1,111 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.utils.preflight import run_preflight
+
+
+STAND_IN_PAGES = {
+    "/": "<html><body><nav id='navbarNavDropdown'></nav></body></html>",
+    "/careers": """
+        <html><body>
+            <section id='career-our-location'></section>
+            <h2>Life at <b>Insider</b></h2>
+            <a href='/teams'>See all
+                teams</a>
+            <script>var markup = "<a>Hidden link</a>";</script>
+        </body></html>
+    """
+}
+
+# Redirect chain like the real site: /careers-redirect -> /careers-redirect/ -> /careers
+STAND_IN_REDIRECTS = {
+    "/careers-redirect": "/careers-redirect/",
+    "/careers-redirect/": "/careers"
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves STAND_IN_PAGES in place of the real site
+    """
+
+    def do_GET(self):
+        if self.path in STAND_IN_REDIRECTS:
+            self.send_response(301)
+            self.send_header("Location", STAND_IN_REDIRECTS[self.path])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = STAND_IN_PAGES.get(self.path)
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write((body or "Not found").encode("utf-8"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stand_in_url():
+    """
+    Starts a local HTTP stand-in for the careers site
+
+    Returns:
+        str: Base URL of the stand-in server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_preflight_passes_against_stand_in(stand_in_url):
+    """
+    Markers split across tags and whitespace are still found
+    """
+    results = run_preflight({
+        'home': {'url': f"{stand_in_url}/", 'ids': ['navbarNavDropdown']},
+        'careers': {
+            'url': f"{stand_in_url}/careers",
+            'ids': ['career-our-location'],
+            'links': ['See all teams'],
+            'texts': ['Life at Insider']
+        }
+    }, timeout=5)
+
+    assert all(result.passed for result in results.values()), [r.describe() for r in results.values()]
+
+
+def test_preflight_reports_missing_markers_and_errors(stand_in_url):
+    """
+    Missing markers, HTTP errors and unreachable hosts all fail with a readable reason
+    """
+    results = run_preflight({
+        'careers': {
+            'url': f"{stand_in_url}/careers",
+            'ids': ['career-find-our-calling'],
+            'links': ['Hidden link']
+        },
+        'qa_careers': {'url': f"{stand_in_url}/careers/quality-assurance/"},
+        'offline': {'url': "http://127.0.0.1:9/"}
+    }, timeout=2)
+
+    assert results['careers'].missing == ["#career-find-our-calling", "link 'Hidden link'"]
+    assert results['qa_careers'].status == 404
+    assert results['offline'].error is not None
+    assert not any(result.passed for result in results.values())
+
+
+def test_preflight_follows_redirect_chain(stand_in_url):
+    """
+    A page behind two redirects passes with the markers of the final page
+    """
+    results = run_preflight({
+        'careers': {'url': f"{stand_in_url}/careers-redirect", 'ids': ['career-our-location']}
+    }, timeout=5)
+
+    assert results['careers'].passed, results['careers'].describe()
@@ -0,0 +1,134 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+import urllib3
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from src.config.config import REMOTE_WEBDRIVER
+from src.utils.event_logger import get_logger
+from src.utils.remote_driver import RemoteDriverPool
+
+
+# Nodes that never run a server; only their slot lock files are used
+UNUSED_NODE = "http://slot-test.invalid:4444"
+CLOSED_PORT_NODE = "http://127.0.0.1:9"
+
+
+@pytest.fixture(scope="module")
+def standalone_browser():
+    """
+    Browser offered by the Selenium standalone server at the first configured node.
+    Skips when no server is reachable.
+
+    Returns:
+        str: 'chrome' or 'firefox'
+    """
+    url = REMOTE_WEBDRIVER['nodes'][0]
+    try:
+        response = urllib3.PoolManager().request("GET", f"{url}/status", timeout=3, retries=False)
+        status = json.loads(response.data)['value']
+    except (urllib3.exceptions.HTTPError, ValueError, KeyError):
+        pytest.skip(f"No Selenium standalone server reachable at {url}")
+    if not status.get('ready'):
+        pytest.skip(f"Selenium standalone server at {url} is not ready")
+    try:
+        return status['nodes'][0]['slots'][0]['stereotype']['browserName']
+    except (KeyError, IndexError):
+        return "chrome"
+
+
+def test_session_created_and_released_on_standalone(standalone_browser):
+    """
+    A session is created through the pool, runs commands and is released;
+    command latencies are recorded on the shared connection.
+    """
+    options = FirefoxOptions() if standalone_browser == "firefox" else ChromeOptions()
+    options.add_argument("--headless")
+    pool = RemoteDriverPool(REMOTE_WEBDRIVER['nodes'][:1], max_sessions_per_node=1, session_retries=2,
+                            retry_backoff=0.5, slot_timeout=30)
+    try:
+        driver = pool.create_driver(options)
+        driver.get("about:blank")
+        assert driver.session_id
+        pool.release(driver)
+
+        connection = pool._connections[REMOTE_WEBDRIVER['nodes'][0]]
+        summary = connection.latency_summary()
+        assert {"newSession", "get", "quit"} <= set(summary)
+        assert all(stats['count'] >= 1 and stats['max_ms'] >= stats['avg_ms'] for stats in summary.values())
+
+        # The slot was released, so a second session fits in the single slot
+        pool.release(pool.create_driver(options))
+    finally:
+        pool.close()
+
+
+def test_second_slot_times_out_when_node_is_full():
+    pool = RemoteDriverPool([UNUSED_NODE], max_sessions_per_node=1, slot_timeout=0.5)
+    node, lock_file = pool._acquire_slot()
+    try:
+        assert node == UNUSED_NODE
+        with pytest.raises(TimeoutError):
+            pool._acquire_slot()
+    finally:
+        pool._release_slot(lock_file)
+
+    node, lock_file = pool._acquire_slot()
+    pool._release_slot(lock_file)
+
+
+def test_session_creation_retries_with_backoff_then_releases_slot():
+    pool = RemoteDriverPool([CLOSED_PORT_NODE], max_sessions_per_node=1, session_retries=2,
+                            retry_backoff=0.01, slot_timeout=0.5)
+    log = get_logger()
+    log.drain()
+    try:
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            pool.create_driver(ChromeOptions())
+
+        failures = [e for e in log.snapshot() if e['msg'] == "Remote session creation failed"]
+        assert [(e['attempt'], e['retry_in']) for e in failures] == [(1, 0.01), (2, 0.02)]
+
+        # Slot was given back, so it can be acquired again without waiting
+        _, lock_file = pool._acquire_slot()
+        pool._release_slot(lock_file)
+    finally:
+        pool.close()
+
+
+def test_unexpected_error_releases_slot():
+    pool = RemoteDriverPool([CLOSED_PORT_NODE], max_sessions_per_node=1, slot_timeout=0.5)
+    try:
+        # Not a browser options object, fails before any request is sent
+        with pytest.raises(AttributeError):
+            pool.create_driver(object())
+
+        _, lock_file = pool._acquire_slot()
+        pool._release_slot(lock_file)
+    finally:
+        pool.close()
+
+
+def test_close_quits_unreleased_sessions_and_frees_their_slots():
+    pool = RemoteDriverPool([UNUSED_NODE], max_sessions_per_node=2, slot_timeout=0.5)
+    quit_calls = []
+
+    def failing_quit():
+        quit_calls.append("s2")
+        raise ConnectionError("node went away")
+
+    # Sessions whose fixture never reached release(), e.g. after a dropped connection
+    for session_id, quit in (("s1", lambda: quit_calls.append("s1")), ("s2", failing_quit)):
+        _, lock_file = pool._acquire_slot()
+        pool._slots[session_id] = (SimpleNamespace(session_id=session_id, quit=quit), lock_file)
+
+    pool.close()
+
+    assert sorted(quit_calls) == ["s1", "s2"]
+    assert pool._slots == {}
+    # Both slots are free again, including the one whose quit() failed
+    held = [pool._acquire_slot()[1] for _ in range(2)]
+    for lock_file in held:
+        pool._release_slot(lock_file)
@@ -0,0 +1,135 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from src.utils.run_metrics import RunMetrics, read_snapshots, render_prometheus
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    """
+    RunMetrics of a fake worker writing to a temporary snapshot directory
+    """
+    return RunMetrics("gw0", str(tmp_path / "workers"), buckets=[5, 10, 30])
+
+
+def report(when, outcome, duration=1.0, node=None):
+    """
+    Minimal stand-in for a pytest TestReport
+    """
+    fields = dict(nodeid="test_x.py::test_a", when=when, outcome=outcome,
+                  passed=outcome == "passed", duration=duration)
+    if node is not None:
+        fields['node'] = node
+    return SimpleNamespace(**fields)
+
+
+def snapshot(worker, counters=None, durations=None, gauges=None):
+    return {
+        'worker': worker,
+        'updated': 1700000000.0,
+        'last_activity': 1700000000.0,
+        'buckets': [5, 10, 30],
+        'counters': counters or {},
+        'durations': durations or {},
+        'gauges': gauges or {}
+    }
+
+
+def metric_value(text, line_prefix):
+    matches = [line for line in text.splitlines() if line.startswith(line_prefix + " ")]
+    assert len(matches) == 1, f"{line_prefix} not rendered exactly once"
+    return float(matches[0].rsplit(" ", 1)[1])
+
+
+def test_histogram_buckets_are_cumulative_and_inf_matches_count():
+    text = render_prometheus([snapshot("gw0", durations={
+        'chrome': {'buckets': [2, 1, 3], 'sum': 70.5, 'count': 7}
+    })])
+
+    name = 'ui_test_duration_seconds'
+    labels = 'worker="gw0",browser="chrome"'
+    assert metric_value(text, f'{name}_bucket{{{labels},le="5"}}') == 2
+    assert metric_value(text, f'{name}_bucket{{{labels},le="10"}}') == 3
+    assert metric_value(text, f'{name}_bucket{{{labels},le="30"}}') == 6
+    # The test above 30s only shows up in +Inf
+    assert metric_value(text, f'{name}_bucket{{{labels},le="+Inf"}}') == 7
+    assert metric_value(text, f'{name}_count{{{labels}}}') == 7
+    assert metric_value(text, f'{name}_sum{{{labels}}}') == 70.5
+
+
+def test_snapshots_of_all_workers_are_merged():
+    text = render_prometheus([
+        snapshot("gw0", counters={'passed': {'chrome': 3}}, gauges={'active_browsers': 1}),
+        snapshot("gw1", counters={'passed': {'chrome': 2, 'firefox': 1}},
+                 gauges={'active_browsers': 2, 'result_sink_queue_depth': 4})
+    ])
+
+    assert metric_value(text, 'ui_tests_passed_total{worker="gw0",browser="chrome"}') == 3
+    assert metric_value(text, 'ui_tests_passed_total{worker="gw1",browser="chrome"}') == 2
+    assert metric_value(text, 'ui_tests_passed_total{worker="gw1",browser="firefox"}') == 1
+    assert metric_value(text, 'ui_tests_active_browsers{worker="gw0"}') == 1
+    assert metric_value(text, 'ui_tests_active_browsers{worker="gw1"}') == 2
+    # Gauges a worker has not reported yet are rendered as 0
+    assert metric_value(text, 'ui_tests_result_sink_queue_depth{worker="gw0"}') == 0
+    assert metric_value(text, 'ui_tests_result_sink_queue_depth{worker="gw1"}') == 4
+    assert text.count("# TYPE ui_tests_passed_total counter") == 1
+
+
+def test_write_snapshot_replaces_file_atomically(metrics):
+    metrics.increment('passed', 'chrome')
+    metrics.write_snapshot()
+    metrics.increment('passed', 'chrome')
+    metrics.write_snapshot()
+
+    directory = os.path.dirname(metrics.snapshot_path)
+    assert os.listdir(directory) == ["gw0.json"]
+    assert read_snapshots(directory)[0]['counters']['passed'] == {'chrome': 2}
+
+
+def test_read_snapshots_skips_partial_files(metrics):
+    metrics.write_snapshot()
+    directory = os.path.dirname(metrics.snapshot_path)
+    with open(os.path.join(directory, "gw1.json"), "w") as f:
+        f.write('{"worker": "gw1", "coun')
+    # Temporary files of an in-progress write are never picked up
+    with open(os.path.join(directory, "gw2.json.tmp"), "w") as f:
+        json.dump(snapshot("gw2"), f)
+
+    assert [s['worker'] for s in read_snapshots(directory)] == ["gw0"]
+
+
+def test_setup_skip_is_counted_as_skipped(metrics):
+    metrics.record_report(report("setup", "skipped"), "chrome")
+    metrics.record_report(report("teardown", "passed"), "chrome")
+
+    assert metrics.counters['skipped'] == {'chrome': 1}
+    assert metrics.counters['passed'] == {}
+    assert metrics.durations == {}
+
+
+def test_call_phase_is_counted_once_with_its_duration(metrics):
+    for when in ("setup", "call", "teardown"):
+        metrics.record_report(report(when, "passed", duration=12.0), "firefox")
+
+    assert metrics.counters['passed'] == {'firefox': 1}
+    assert metrics.durations['firefox']['buckets'] == [0, 0, 1]
+    assert metrics.durations['firefox']['count'] == 1
+
+
+def test_rerun_is_counted_as_rerun(metrics):
+    metrics.record_report(report("call", "rerun"), "chrome")
+    metrics.record_report(report("call", "passed"), "chrome")
+
+    assert metrics.counters['rerun'] == {'chrome': 1}
+    assert metrics.counters['passed'] == {'chrome': 1}
+    assert metrics.counters['failed'] == {}
+
+
+def test_controller_ignores_reports_forwarded_by_workers(metrics):
+    metrics.record_report(report("call", "failed", node=object()), "chrome")
+    metrics.record_report(report("setup", "skipped", node=object()), "chrome")
+
+    assert all(values == {} for values in metrics.counters.values())
+    assert metrics.durations == {}
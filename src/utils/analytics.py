@@ -0,0 +1,450 @@
+"""
+Offline analytics over historical UI test results.
+
+Usage:
+    python -m src.utils.analytics export             # MySQL results + step timings -> columnar .npz
+    python -m src.utils.analytics analyze            # Percentile trends, failure rates, regressions
+    python -m src.utils.analytics analyze --publish  # Also writes the tables used by Grafana
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from src.config.config import ANALYTICS
+from src.utils.db_controller import fetch_test_results_from_mysql, run_mysql_script
+
+
+QUANTILES = (0.50, 0.95, 0.99)
+
+
+def _encode(values):
+    """
+    Dictionary-encodes a column
+
+    Returns:
+        tuple: (int32 codes, array of distinct values)
+    """
+    names, codes = np.unique(np.asarray(values), return_inverse=True)
+    return codes.astype(np.int32), names
+
+
+def _split_lines(raw, chunk_bytes):
+    """
+    Yields newline aligned slices of about chunk_bytes so parsing memory stays bounded
+    """
+    start = 0
+    while start < len(raw):
+        end = raw.find(b"\n", start + chunk_bytes)
+        if end == -1:
+            end = len(raw)
+        yield raw[start:end]
+        start = end + 1
+
+
+def parse_results(raw, chunk_bytes=32 * 1024 * 1024):
+    """
+    Parses the tab separated MySQL export into columns
+
+    Args:
+        raw (bytes): Output of fetch_test_results_from_mysql
+        chunk_bytes: Size of the slices parsed at once
+
+    Returns:
+        dict: ts, duration, failed, test, browser columns plus test_names and browser_names
+    """
+    raw = raw.strip(b"\n")
+    if not raw:
+        return None
+
+    # Few distinct names, so encode them with a dict instead of sorting millions of strings
+    name_index = {}
+    columns = {'ts': [], 'duration': [], 'failed': [], 'name': []}
+    for chunk in _split_lines(raw, chunk_bytes):
+        # One split per chunk; every 4th field belongs to the same column
+        fields = chunk.replace(b"\n", b"\t").split(b"\t")
+        if len(fields) % 4:
+            raise ValueError("Malformed results export: expected 4 tab separated columns per row")
+        rows = len(fields) // 4
+        columns['name'].append(np.fromiter((name_index.setdefault(name, len(name_index)) for name in fields[0::4]),
+                                           dtype=np.int32, count=rows))
+        columns['failed'].append(np.fromiter((status == b"failed" for status in fields[1::4]), dtype=bool, count=rows))
+        columns['duration'].append(np.fromiter(map(float, fields[2::4]), dtype=np.float64, count=rows))
+        columns['ts'].append(np.fromiter(map(int, fields[3::4]), dtype=np.int64, count=rows))
+        del fields
+
+    # Parametrized names look like "test_insider_career_page[chrome]"
+    split = [name.decode().partition("[") for name in name_index]
+    test_codes, test_names = _encode([base for base, _, _ in split])
+    browser_codes, browser_names = _encode([param.rstrip("]") or "unknown" for _, _, param in split])
+
+    name_codes = np.concatenate(columns['name'])
+    return {
+        'ts': np.concatenate(columns['ts']),
+        'duration': np.concatenate(columns['duration']),
+        'failed': np.concatenate(columns['failed']),
+        'test': test_codes[name_codes],
+        'browser': browser_codes[name_codes],
+        'test_names': test_names,
+        'browser_names': browser_names
+    }
+
+
+def parse_step_timings(paths):
+    """
+    Reads step durations recorded by the event logger
+
+    Args:
+        paths: JSONL files written by EventLogger
+
+    Returns:
+        dict: step_ts, step_duration, step_failed, step_test, step_browser, step columns
+              with their *_names arrays, or None if no steps were recorded
+    """
+    ts, duration, failed, tests, browsers, steps = [], [], [], [], [], []
+    for path in paths:
+        with open(path, 'rb') as f:
+            for line in f:
+                # Cheap pre-filter so only step events are decoded
+                if b'"Step finished' not in line and b'"Step failed' not in line:
+                    continue
+                event = json.loads(line)
+                if 'step' not in event or 'duration' not in event:
+                    continue
+                ts.append(int(event['ts']))
+                duration.append(event['duration'])
+                failed.append(event['lvl'] == 'ERROR')
+                tests.append(event.get('test', '').rpartition("::")[2].partition("[")[0])
+                browsers.append(event.get('browser', 'unknown'))
+                steps.append(event['step'])
+    if not ts:
+        return None
+
+    test_codes, test_names = _encode(tests)
+    browser_codes, browser_names = _encode(browsers)
+    step_codes, step_names = _encode(steps)
+    return {
+        'step_ts': np.array(ts, dtype=np.int64),
+        'step_duration': np.array(duration, dtype=np.float64),
+        'step_failed': np.array(failed, dtype=bool),
+        'step_test': test_codes,
+        'step_browser': browser_codes,
+        'step': step_codes,
+        'step_test_names': test_names,
+        'step_browser_names': browser_names,
+        'step_names': step_names
+    }
+
+
+def export(path, events_glob):
+    """
+    Bulk exports results and step timings to a compressed columnar .npz file
+
+    Args:
+        path: Output file
+        events_glob: Glob pattern of event log files holding step timings
+    """
+    columns = parse_results(fetch_test_results_from_mysql())
+    if columns is None:
+        raise RuntimeError("No test results found in MySQL")
+    steps = parse_step_timings(sorted(glob.glob(events_glob)))
+    if steps:
+        columns.update(steps)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(path, **columns)
+    step_count = len(steps['step_ts']) if steps else 0
+    print(f"Exported {len(columns['ts'])} results and {step_count} step timings to {path}")
+
+
+def bucket_statistics(ts, duration, failed, group, bucket_seconds):
+    """
+    Computes run count, p50/p95/p99 duration and failure rate per group and time bucket.
+    Rows are sorted once by (group, bucket, duration) so every percentile is a direct index.
+
+    Args:
+        ts: Unix timestamps
+        duration: Durations in seconds
+        failed: Boolean failure flags
+        group: Integer group codes
+        bucket_seconds: Width of each time bucket
+
+    Returns:
+        dict: group, bucket_start, runs, p50, p95, p99 and failure_rate arrays (one row per bucket)
+    """
+    bucket = ts // bucket_seconds
+    first_bucket = bucket.min()
+    bucket_count = bucket.max() - first_bucket + 1
+    key = group.astype(np.int64) * bucket_count + (bucket - first_bucket)
+
+    order = np.lexsort((duration, key))
+    key = key[order]
+    duration = duration[order]
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(key)) + 1))
+    runs = np.diff(np.append(starts, len(key)))
+    unique_keys = key[starts]
+
+    stats = {
+        'group': (unique_keys // bucket_count).astype(np.int32),
+        'bucket_start': (unique_keys % bucket_count + first_bucket) * bucket_seconds,
+        'runs': runs,
+        'failure_rate': np.add.reduceat(failed[order].astype(np.float64), starts) / runs
+    }
+    for q in QUANTILES:
+        # Linear interpolation between the closest ranks, as np.percentile does
+        position = starts + (runs - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        stats[f"p{int(q * 100)}"] = duration[lower] + (duration[upper] - duration[lower]) * (position - lower)
+    return stats
+
+
+def change_point(values, min_segment):
+    """
+    Finds the split that best separates a series into two segments with different means
+
+    Args:
+        values: Durations ordered by time
+        min_segment: Minimum number of values on each side of the split
+
+    Returns:
+        tuple: (split index, t-score, mean before, mean after) or None if the series is too short
+    """
+    n = len(values)
+    if n < 2 * min_segment:
+        return None
+    csum = np.cumsum(values)
+    csum_sq = np.cumsum(values * values)
+
+    left = np.arange(min_segment, n - min_segment + 1)
+    right = n - left
+    mean_left = csum[left - 1] / left
+    mean_right = (csum[-1] - csum[left - 1]) / right
+    scatter = (csum_sq[left - 1] - left * mean_left ** 2) + (csum_sq[-1] - csum_sq[left - 1] - right * mean_right ** 2)
+    variance = np.maximum(scatter / (n - 2), 1e-12)
+    score = (mean_right - mean_left) / np.sqrt(variance * (1.0 / left + 1.0 / right))
+
+    best = int(np.argmax(score))
+    return int(left[best]), float(score[best]), float(mean_left[best]), float(mean_right[best])
+
+
+def detect_regressions(ts, duration, group, min_segment, min_increase, min_score):
+    """
+    Runs change-point detection on the duration history of every group
+
+    Returns:
+        list: dicts with group, change_at, mean_before, mean_after, increase_pct and score
+    """
+    order = np.lexsort((ts, group))
+    ts = ts[order]
+    duration = duration[order]
+    group = group[order]
+    bounds = np.append(np.concatenate(([0], np.flatnonzero(np.diff(group)) + 1)), len(group))
+
+    regressions = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        result = change_point(duration[start:end], min_segment)
+        if result is None:
+            continue
+        split, score, before, after = result
+        increase = after / before - 1 if before > 0 else 0.0
+        if score >= min_score and increase >= min_increase:
+            regressions.append({
+                'group': int(group[start]),
+                'change_at': int(ts[start + split]),
+                'mean_before': before,
+                'mean_after': after,
+                'increase_pct': increase * 100,
+                'score': score
+            })
+    return regressions
+
+
+def _analyze_dataset(ts, duration, failed, codes, labels, settings):
+    """
+    Groups rows by their label codes and runs trend and regression analysis
+
+    Args:
+        codes: List of integer code columns identifying a group (e.g. test, browser)
+        labels: Function turning one row of codes into a (test, browser, step) tuple
+    """
+    # Mixed-radix key so grouping is a single 1-D unique instead of a row-wise one
+    sizes = [int(c.max()) + 1 for c in codes]
+    combined = np.zeros(len(ts), dtype=np.int64)
+    for column, size in zip(codes, sizes):
+        combined = combined * size + column
+    group_keys, group = np.unique(combined, return_inverse=True)
+    group = group.reshape(-1).astype(np.int32)
+
+    group_labels = []
+    for key in group_keys.tolist():
+        row = []
+        for size in reversed(sizes):
+            key, code = divmod(key, size)
+            row.append(code)
+        group_labels.append(labels(row[::-1]))
+
+    stats = bucket_statistics(ts, duration, failed, group, int(settings['bucket_hours'] * 3600))
+    trends = [
+        group_labels[g] + (int(start), int(runs), float(p50), float(p95), float(p99), float(rate))
+        for g, start, runs, p50, p95, p99, rate in zip(
+            stats['group'], stats['bucket_start'], stats['runs'],
+            stats['p50'], stats['p95'], stats['p99'], stats['failure_rate']
+        )
+    ]
+
+    regressions = [
+        group_labels[r['group']] + (r['change_at'], r['mean_before'], r['mean_after'], r['increase_pct'], r['score'])
+        for r in detect_regressions(ts, duration, group, settings['min_segment'],
+                                    settings['regression_increase'], settings['regression_score'])
+    ]
+    return trends, regressions
+
+
+def analyze(path, settings):
+    """
+    Computes trends and regressions for whole tests and, when recorded, individual steps
+
+    Args:
+        path: .npz file written by export
+        settings: ANALYTICS configuration
+
+    Returns:
+        tuple: (trend rows, regression rows)
+    """
+    data = np.load(path)
+    test_names = data['test_names']
+    browser_names = data['browser_names']
+    trends, regressions = _analyze_dataset(
+        data['ts'], data['duration'], data['failed'],
+        [data['test'], data['browser']],
+        lambda row: (str(test_names[row[0]]), str(browser_names[row[1]]), ""),
+        settings
+    )
+
+    if 'step_ts' in data:
+        step_tests = data['step_test_names']
+        step_browsers = data['step_browser_names']
+        step_names = data['step_names']
+        step_trends, step_regressions = _analyze_dataset(
+            data['step_ts'], data['step_duration'], data['step_failed'],
+            [data['step_test'], data['step_browser'], data['step']],
+            lambda row: (str(step_tests[row[0]]), str(step_browsers[row[1]]), str(step_names[row[2]])),
+            settings
+        )
+        trends += step_trends
+        regressions += step_regressions
+    return trends, regressions
+
+
+TREND_COLUMNS = ("test_name", "browser", "step", "bucket_start", "runs", "p50", "p95", "p99", "failure_rate")
+REGRESSION_COLUMNS = ("test_name", "browser", "step", "change_at", "mean_before", "mean_after", "increase_pct", "score")
+
+
+def write_csv(path, columns, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def _sql_value(value):
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+    return repr(round(value, 4)) if isinstance(value, float) else str(value)
+
+
+def publish(trends, regressions, settings, chunk_size=1000):
+    """
+    Replaces the Grafana analytics tables with the latest results
+
+    Args:
+        trends: Rows in TREND_COLUMNS order
+        regressions: Rows in REGRESSION_COLUMNS order
+        settings: ANALYTICS configuration
+    """
+    trends_table = settings['trends_table']
+    regressions_table = settings['regressions_table']
+    statements = [
+        f"""CREATE TABLE IF NOT EXISTS {trends_table} (
+            bucket_start DATETIME NOT NULL, test_name VARCHAR(255) NOT NULL, browser VARCHAR(50) NOT NULL,
+            step VARCHAR(255) NOT NULL, runs INT NOT NULL, p50 FLOAT, p95 FLOAT, p99 FLOAT, failure_rate FLOAT);""",
+        f"""CREATE TABLE IF NOT EXISTS {regressions_table} (
+            detected_at DATETIME NOT NULL, test_name VARCHAR(255) NOT NULL, browser VARCHAR(50) NOT NULL,
+            step VARCHAR(255) NOT NULL, change_at DATETIME NOT NULL, mean_before FLOAT, mean_after FLOAT,
+            increase_pct FLOAT, score FLOAT);""",
+        f"TRUNCATE TABLE {trends_table};",
+        f"TRUNCATE TABLE {regressions_table};"
+    ]
+
+    for i in range(0, len(trends), chunk_size):
+        values = ",".join(
+            f"(FROM_UNIXTIME({start}),{_sql_value(test)},{_sql_value(browser)},{_sql_value(step)},{runs},"
+            f"{_sql_value(p50)},{_sql_value(p95)},{_sql_value(p99)},{_sql_value(rate)})"
+            for test, browser, step, start, runs, p50, p95, p99, rate in trends[i:i + chunk_size]
+        )
+        statements.append(f"INSERT INTO {trends_table} "
+                          f"(bucket_start, test_name, browser, step, runs, p50, p95, p99, failure_rate) VALUES {values};")
+
+    if regressions:
+        values = ",".join(
+            f"(NOW(),{_sql_value(test)},{_sql_value(browser)},{_sql_value(step)},FROM_UNIXTIME({change_at}),"
+            f"{_sql_value(before)},{_sql_value(after)},{_sql_value(increase)},{_sql_value(score)})"
+            for test, browser, step, change_at, before, after, increase, score in regressions
+        )
+        statements.append(f"INSERT INTO {regressions_table} (detected_at, test_name, browser, step, change_at, "
+                          f"mean_before, mean_after, increase_pct, score) VALUES {values};")
+
+    run_mysql_script("\n".join(statements))
+    print(f"Published {len(trends)} trend rows and {len(regressions)} regressions to MySQL")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline analytics over historical UI test results")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subcommands.add_parser("export", help="Export MySQL results and step timings to .npz")
+    export_parser.add_argument("--output", default=ANALYTICS['export_path'])
+    export_parser.add_argument("--events", default=ANALYTICS['events_glob'], help="Glob of event log files")
+
+    analyze_parser = subcommands.add_parser("analyze", help="Compute trends and detect duration regressions")
+    analyze_parser.add_argument("--input", default=ANALYTICS['export_path'])
+    analyze_parser.add_argument("--bucket-hours", type=float, default=ANALYTICS['bucket_hours'])
+    analyze_parser.add_argument("--publish", action="store_true", help="Write results to the Grafana tables")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        export(args.output, args.events)
+        return 0
+
+    settings = dict(ANALYTICS, bucket_hours=args.bucket_hours)
+    start = time.perf_counter()
+    trends, regressions = analyze(args.input, settings)
+    print(f"Analyzed {args.input} in {time.perf_counter() - start:.2f}s")
+
+    output_dir = os.path.dirname(args.input) or "."
+    write_csv(os.path.join(output_dir, "trends.csv"), TREND_COLUMNS, trends)
+    write_csv(os.path.join(output_dir, "regressions.csv"), REGRESSION_COLUMNS, regressions)
+
+    for test, browser, step, change_at, before, after, increase, score in regressions:
+        name = f"{test}[{browser}]" + (f" / {step}" if step else "")
+        changed = time.strftime('%Y-%m-%d %H:%M', time.localtime(change_at))
+        print(f"REGRESSION {name}: {before:.2f}s -> {after:.2f}s (+{increase:.0f}%, score {score:.1f}) since {changed}")
+    if not regressions:
+        print("No duration regressions detected")
+
+    if args.publish:
+        publish(trends, regressions, settings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,13 @@
 import subprocess
 import shlex
 import os
+import queue
+import threading
 from src.config.config import MYSQL_DB
+from src.utils.event_logger import get_logger
 
 
-def insert_test_result_to_mysql(test_name, status, duration, timestamp):
+def insert_test_result_to_mysql(test_name, status, duration, timestamp, log_context=None):
     """
     Inserts a test result into the MySQL database using direct MySQL commands.
     Assumes the database and table already exist in the mysql-qa Docker container.
@@ -14,7 +17,12 @@ def insert_test_result_to_mysql(test_name, status, duration, timestamp):
         status (str): Status of the test ('passed' or 'failed')
         duration (float): Duration of the test execution in seconds
         timestamp (datetime.datetime): Timestamp of the test execution (UTC)
+        log_context (dict): Logger context of the test that produced the result. Events are
+            logged with it instead of the currently bound context, which may already belong
+            to another test when the insert runs in the background.
     """
+    log = get_logger()
+    context = dict(log_context or {}, test=test_name)
     try:
         # Format timestamp for MySQL
         formatted_timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
@@ -43,10 +51,110 @@ def insert_test_result_to_mysql(test_name, status, duration, timestamp):
         # Check if there was an error
         if process.returncode != 0:
             error_message = stderr.decode('utf-8').strip()
-            print(f"⚠️ MySQL command error: {error_message}")
+            log.log_detached(context, 'ERROR', "MySQL command error", error=error_message)
             return
             
-        print(f"📊 Test result saved to mysql-qa database: {test_name} | {status} | {duration:.2f}s")
+        log.log_detached(context, 'DEBUG', "MySQL insert completed", status=status,
+                         duration=round(float(duration), 2))
             
     except Exception as e:
-        print(f"⚠️ Error saving test result: {e}") 
\ No newline at end of file
+        log.log_detached(context, 'ERROR', "Error saving test result", error=str(e))
+
+
+def run_mysql_script(sql):
+    """
+    Runs SQL statements inside the mysql-qa Docker container and returns the raw output.
+    Statements are sent on stdin, so large batches are not limited by the command line length.
+
+    Args:
+        sql (str): One or more SQL statements
+
+    Returns:
+        bytes: Tab separated output without column headers
+
+    Raises:
+        RuntimeError: If the mysql client exits with an error
+    """
+    docker_cmd = [
+        "docker", "exec", "-i", "mysql-qa",
+        "mysql", "-u", MYSQL_DB['user'], f"-p{MYSQL_DB['password']}",
+        "--batch", "--raw", "--skip-column-names", MYSQL_DB['database']
+    ]
+    process = subprocess.run(docker_cmd, input=sql.encode('utf-8'), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        raise RuntimeError(f"MySQL command error: {process.stderr.decode('utf-8').strip()}")
+    return process.stdout
+
+
+def fetch_test_results_from_mysql():
+    """
+    Bulk exports every stored test result in a single query.
+
+    Returns:
+        bytes: Tab separated rows of test_name, status, duration, unix timestamp
+    """
+    return run_mysql_script(
+        f"SELECT test_name, status, duration, UNIX_TIMESTAMP(timestamp) FROM {MYSQL_DB['table']};"
+    )
+
+
+class ResultSink:
+    """
+    Background writer for test results so MySQL inserts never block the test run.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="result-sink", daemon=True)
+        self._writer.start()
+
+    def submit(self, test_name, status, duration, timestamp):
+        """
+        Queues a test result for insertion (same arguments as insert_test_result_to_mysql).
+        The logger context is captured now, while it still describes the submitting test.
+        """
+        log_context = dict(get_logger().context)
+        self._queue.put((test_name, status, duration, timestamp, log_context))
+
+    def pending(self):
+        """
+        Returns:
+            int: Results queued or currently being written
+        """
+        return self._queue.unfinished_tasks
+
+    def _write_loop(self):
+        while True:
+            result = self._queue.get()
+            try:
+                if result is None:
+                    return
+                insert_test_result_to_mysql(*result)
+            finally:
+                self._queue.task_done()
+
+    def close(self, timeout=30):
+        """
+        Waits for queued results to be written, then stops the writer
+        """
+        self._queue.put(None)
+        self._writer.join(timeout=timeout)
+
+
+_result_sink = None
+_result_sink_lock = threading.Lock()
+
+
+def get_result_sink():
+    """
+    Returns the process-wide ResultSink, starting it on first use.
+
+    Returns:
+        ResultSink: shared result sink
+    """
+    global _result_sink
+    if _result_sink is None:
+        with _result_sink_lock:
+            if _result_sink is None:
+                _result_sink = ResultSink()
+    return _result_sink
@@ -0,0 +1,256 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+from src.config.config import EVENT_LOG
+
+
+LEVELS = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARNING': 30,
+    'ERROR': 40
+}
+
+
+class EventLogger:
+    """
+    Structured event logger used instead of print() across the framework.
+
+    Every event is kept in an in-memory ring buffer with the current run, test and
+    step context. Events at or above the configured level are also queued for a
+    background thread that appends them to a compact JSONL file.
+    """
+
+    def __init__(self, path, level='INFO', buffer_size=500, flush_interval=1.0, run_id=None):
+        """
+        EventLogger constructor
+
+        Args:
+            path: JSONL file the background writer appends to
+            level: Minimum level written to the file (all levels are buffered)
+            buffer_size: Maximum number of events kept in memory
+            flush_interval: Seconds between background writes
+            run_id: Identifier shared by every event of the run
+        """
+        self.path = path
+        self.level = LEVELS[level.upper()]
+        self.flush_interval = flush_interval
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.context = {}
+        self.buffer = deque(maxlen=buffer_size)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="event-log-writer", daemon=True)
+        self._writer.start()
+
+    def bind(self, **fields):
+        """
+        Sets context fields (e.g. test, browser) attached to every following event.
+        Passing None for a field removes it.
+        """
+        for key, value in fields.items():
+            if value is None:
+                self.context.pop(key, None)
+            else:
+                self.context[key] = value
+
+    @contextmanager
+    def step(self, name):
+        """
+        Context manager that tags events with a step name and logs its duration
+        """
+        previous = self.context.get('step')
+        self.bind(step=name)
+        self.info(f"Step started: {name}")
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.error(f"Step failed: {name}", duration=round(time.perf_counter() - start, 3), error=str(e))
+            raise
+        except BaseException as e:
+            # pytest.skip()/xfail() and interrupts stop the step without failing it
+            self.info(f"Step stopped: {name}", duration=round(time.perf_counter() - start, 3),
+                      outcome=type(e).__name__)
+            raise
+        else:
+            self.info(f"Step finished: {name}", duration=round(time.perf_counter() - start, 3))
+        finally:
+            self.bind(step=previous)
+
+    def log(self, level, message, **fields):
+        """
+        Records an event in the ring buffer and queues it for the JSONL file
+
+        Args:
+            level: One of DEBUG, INFO, WARNING, ERROR
+            message: Human readable message
+            **fields: Extra structured data stored with the event
+        """
+        event = self._event(level, message, self.context, fields)
+        with self._lock:
+            self.buffer.append(event)
+        self._emit(event)
+
+    def log_detached(self, context, level, message, **fields):
+        """
+        Records an event on behalf of a context that is no longer bound, e.g. from a
+        background thread finishing work queued by an earlier test. The event goes
+        to the JSONL file only, so it never shows up in the current test's buffer.
+
+        Args:
+            context: Context fields captured when the work was queued
+            level: One of DEBUG, INFO, WARNING, ERROR
+            message: Human readable message
+            **fields: Extra structured data stored with the event
+        """
+        self._emit(self._event(level, message, context, fields))
+
+    def _event(self, level, message, context, fields):
+        event = {'ts': round(time.time(), 3), 'lvl': level, 'run': self.run_id}
+        event.update(context)
+        event['msg'] = message
+        event.update(fields)
+        return event
+
+    def _emit(self, event):
+        if LEVELS[event['lvl']] < self.level:
+            return
+        if self._stopped.is_set():
+            # Writer thread is gone; late events (e.g. from unconfigure hooks) are written directly
+            self._write([event])
+        else:
+            self._queue.put(event)
+
+    def debug(self, message, **fields):
+        self.log('DEBUG', message, **fields)
+
+    def info(self, message, **fields):
+        self.log('INFO', message, **fields)
+
+    def warning(self, message, **fields):
+        self.log('WARNING', message, **fields)
+
+    def error(self, message, **fields):
+        self.log('ERROR', message, **fields)
+
+    def snapshot(self):
+        """
+        Returns a copy of the buffered events without clearing them
+
+        Returns:
+            list: Buffered events, oldest first
+        """
+        with self._lock:
+            return list(self.buffer)
+
+    def drain(self):
+        """
+        Returns the buffered events and empties the ring buffer
+
+        Returns:
+            list: Buffered events, oldest first
+        """
+        with self._lock:
+            events = list(self.buffer)
+            self.buffer.clear()
+        return events
+
+    @staticmethod
+    def format_events(events):
+        """
+        Renders events as plain text lines for the test report
+
+        Returns:
+            str: One line per event
+        """
+        lines = []
+        for event in events:
+            extra = {k: v for k, v in event.items() if k not in ('ts', 'lvl', 'run', 'test', 'step', 'msg')}
+            timestamp = time.strftime('%H:%M:%S', time.localtime(event['ts']))
+            step = f" [{event['step']}]" if 'step' in event else ""
+            line = f"{timestamp} {event['lvl']:<7}{step} {event['msg']}"
+            if extra:
+                line += f" {json.dumps(extra, default=str)}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def _write_loop(self):
+        """
+        Background loop that appends queued events to the JSONL file in batches
+        """
+        while not (self._stopped.is_set() and self._queue.empty()):
+            self._stopped.wait(self.flush_interval)
+            self._flush()
+
+    def _flush(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._write_lock, open(self.path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(e, separators=(',', ':'), default=str) + "\n" for e in batch)
+        except OSError:
+            # Logging must never break a test run
+            pass
+
+    def close(self):
+        """
+        Stops the background writer after flushing pending events
+        """
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._writer.join(timeout=5)
+            # Events queued while the writer was exiting
+            self._flush()
+
+
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def get_logger():
+    """
+    Returns the process-wide EventLogger, creating it from EVENT_LOG on first use.
+    Under pytest-xdist each worker writes to its own file and shares the run id.
+
+    Returns:
+        EventLogger: shared logger instance
+    """
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                path = EVENT_LOG['path']
+                worker = os.environ.get("PYTEST_XDIST_WORKER")
+                if worker:
+                    root, ext = os.path.splitext(path)
+                    path = f"{root}-{worker}{ext}"
+                _logger = EventLogger(
+                    path=path,
+                    level=EVENT_LOG['level'],
+                    buffer_size=EVENT_LOG['buffer_size'],
+                    flush_interval=EVENT_LOG['flush_interval'],
+                    run_id=os.environ.get("PYTEST_XDIST_TESTRUNUID")
+                )
+                atexit.register(_logger.close)
+    return _logger
@@ -0,0 +1,162 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+import urllib3
+
+from src.utils.event_logger import get_logger
+
+
+class PageMarkerParser(HTMLParser):
+    """
+    Streaming HTML parser that only collects what the pre-flight markers need:
+    element ids, link texts and visible text. No DOM tree is built.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ids = set()
+        self.link_texts = []
+        self.texts = []
+        self._link_depth = 0
+        self._current_link = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name == "id" and value:
+                self.ids.add(value)
+        if tag in ("script", "style"):
+            self._skip_depth += 1
+        elif tag == "a":
+            self._link_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "a" and self._link_depth:
+            self._link_depth -= 1
+            if not self._link_depth:
+                self.link_texts.append(" ".join("".join(self._current_link).split()))
+                self._current_link = []
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self.texts.append(data)
+        if self._link_depth:
+            self._current_link.append(data)
+
+
+class PreflightResult:
+    """
+    Outcome of checking one page
+    """
+
+    def __init__(self, name, url, status=None, elapsed=0.0, missing=None, error=None):
+        self.name = name
+        self.url = url
+        self.status = status
+        self.elapsed = elapsed
+        self.missing = missing or []
+        self.error = error
+
+    @property
+    def passed(self):
+        return self.error is None and self.status == 200 and not self.missing
+
+    def describe(self):
+        """
+        Returns:
+            str: One line summary used in assertion messages and skip reasons
+        """
+        if self.error:
+            return f"{self.name} ({self.url}): {self.error}"
+        if self.status != 200:
+            return f"{self.name} ({self.url}): HTTP {self.status}"
+        if self.missing:
+            return f"{self.name} ({self.url}): missing {', '.join(self.missing)}"
+        return f"{self.name} ({self.url}): OK in {self.elapsed:.2f}s"
+
+
+def find_missing_markers(html, page):
+    """
+    Parses a page and lists the markers that are not present
+
+    Args:
+        html (str): Page source
+        page (dict): Marker definition with 'ids', 'links' and 'texts'
+
+    Returns:
+        list: Human readable names of missing markers
+    """
+    parser = PageMarkerParser()
+    parser.feed(html)
+    parser.close()
+
+    text = " ".join(" ".join(parser.texts).split())
+    missing = [f"#{marker}" for marker in page.get('ids', []) if marker not in parser.ids]
+    missing += [f"link '{marker}'" for marker in page.get('links', [])
+                if not any(marker in link for link in parser.link_texts)]
+    missing += [f"text '{marker}'" for marker in page.get('texts', []) if marker not in text]
+    return missing
+
+
+def check_page(http, name, page, timeout):
+    """
+    Fetches one page and checks its markers
+
+    Args:
+        http: Shared urllib3.PoolManager
+        name: Page name used in reports
+        page: Marker definition including 'url'
+        timeout: Seconds per request
+
+    Returns:
+        PreflightResult: check outcome
+    """
+    start = time.perf_counter()
+    try:
+        response = http.request("GET", page['url'], timeout=timeout, headers={"User-Agent": "Mozilla/5.0 preflight"})
+        elapsed = time.perf_counter() - start
+        if response.status != 200:
+            return PreflightResult(name, page['url'], status=response.status, elapsed=elapsed)
+        html = response.data.decode("utf-8", errors="replace")
+        return PreflightResult(name, page['url'], status=response.status, elapsed=elapsed,
+                               missing=find_missing_markers(html, page))
+    except urllib3.exceptions.HTTPError as e:
+        # MaxRetryError wraps the underlying connection problem in .reason
+        error = getattr(e, "reason", None) or e
+        return PreflightResult(name, page['url'], elapsed=time.perf_counter() - start, error=str(error))
+
+
+def run_preflight(pages, timeout=10, workers=4):
+    """
+    Checks all pages concurrently over one keep-alive connection pool
+
+    Args:
+        pages (dict): Page name -> marker definition
+        timeout: Seconds per request
+        workers: Number of concurrent requests
+
+    Returns:
+        dict: Page name -> PreflightResult
+    """
+    log = get_logger()
+    # Separate budgets: a shared total would let one transient error or a second
+    # redirect (e.g. /careers -> /careers/ -> locale path) fail a healthy page
+    retries = urllib3.Retry(total=None, connect=1, read=1, redirect=5, backoff_factor=0.5)
+    http = urllib3.PoolManager(maxsize=workers, retries=retries)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(check_page, http, name, page, timeout) for name, page in pages.items()}
+            results = {name: future.result() for name, future in futures.items()}
+    finally:
+        http.clear()
+
+    for result in results.values():
+        if result.passed:
+            log.info("Pre-flight check passed", page=result.name, url=result.url, duration=round(result.elapsed, 3))
+        else:
+            log.error("Pre-flight check failed", page=result.name, detail=result.describe())
+    return results
@@ -0,0 +1,218 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from urllib3.exceptions import HTTPError
+
+from src.utils.event_logger import get_logger
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    Keep-alive connection to a single Grid node, shared by every session of the process.
+    Records the latency of each WebDriver command it sends.
+    """
+
+    def __init__(self, remote_server_addr, pool_maxsize):
+        """
+        PooledRemoteConnection constructor
+
+        Args:
+            remote_server_addr: Grid hub or standalone server URL
+            pool_maxsize: Maximum number of keep-alive HTTP connections kept open
+        """
+        # Must be set before RemoteConnection creates the connection manager
+        self.pool_maxsize = pool_maxsize
+        self.latencies = {}
+        self._stats_lock = threading.Lock()
+        super().__init__(remote_server_addr, keep_alive=True)
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(maxsize=self.pool_maxsize, block=True)
+        return manager
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                stats = self.latencies.setdefault(command, [0, 0.0, 0.0])
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+
+    def close(self):
+        # WebDriver.quit() closes its executor; keep the pool alive for the next session
+        pass
+
+    def shutdown(self):
+        """
+        Closes the underlying HTTP connections
+        """
+        super().close()
+
+    def latency_summary(self):
+        """
+        Returns per-command latency statistics
+
+        Returns:
+            dict: command -> {'count', 'avg_ms', 'max_ms'}
+        """
+        with self._stats_lock:
+            return {
+                command: {
+                    'count': count,
+                    'avg_ms': round(total / count * 1000, 1),
+                    'max_ms': round(peak * 1000, 1)
+                }
+                for command, (count, total, peak) in self.latencies.items()
+            }
+
+
+class RemoteDriverPool:
+    """
+    Creates Remote WebDriver sessions on Selenium Grid / standalone nodes.
+
+    Sessions are bounded per node with lock files, so the limit holds across
+    pytest-xdist workers running on the same agent.
+    """
+
+    def __init__(self, nodes, max_sessions_per_node=4, pool_maxsize=8, session_retries=3,
+                 retry_backoff=2.0, slot_timeout=300):
+        """
+        RemoteDriverPool constructor
+
+        Args:
+            nodes: List of Grid hub or standalone server URLs
+            max_sessions_per_node: Concurrent sessions allowed on each node
+            pool_maxsize: Keep-alive HTTP connections per node
+            session_retries: Attempts to create a session before giving up
+            retry_backoff: Base delay in seconds, doubled after each failed attempt
+            slot_timeout: Seconds to wait for a free session slot
+        """
+        self.nodes = list(nodes)
+        self.max_sessions_per_node = max_sessions_per_node
+        self.pool_maxsize = pool_maxsize
+        self.session_retries = session_retries
+        self.retry_backoff = retry_backoff
+        self.slot_timeout = slot_timeout
+        self.log = get_logger()
+        self._connections = {}
+        self._slots = {}
+        self._lock = threading.Lock()
+        self._lock_dir = os.path.join(tempfile.gettempdir(), "selenium-grid-slots")
+        os.makedirs(self._lock_dir, exist_ok=True)
+
+    def _connection(self, node):
+        with self._lock:
+            if node not in self._connections:
+                self._connections[node] = PooledRemoteConnection(node, self.pool_maxsize)
+            return self._connections[node]
+
+    def _acquire_slot(self):
+        """
+        Blocks until a session slot is free on one of the nodes
+
+        Returns:
+            tuple: (node URL, open lock file holding the slot)
+        """
+        deadline = time.monotonic() + self.slot_timeout
+        while True:
+            for node in self.nodes:
+                node_key = hashlib.sha1(node.encode()).hexdigest()[:10]
+                for slot in range(self.max_sessions_per_node):
+                    lock_file = open(os.path.join(self._lock_dir, f"{node_key}-{slot}.lock"), "w")
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        return node, lock_file
+                    except BlockingIOError:
+                        lock_file.close()
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No free Grid session slot after {self.slot_timeout}s")
+            time.sleep(0.5)
+
+    @staticmethod
+    def _release_slot(lock_file):
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+    def create_driver(self, options):
+        """
+        Starts a remote session, retrying with exponential backoff
+
+        Args:
+            options: Browser options (ChromeOptions, FirefoxOptions)
+
+        Returns:
+            WebDriver: remote browser driver instance
+        """
+        node, lock_file = self._acquire_slot()
+        try:
+            last_error = None
+            for attempt in range(self.session_retries):
+                try:
+                    start = time.perf_counter()
+                    driver = webdriver.Remote(command_executor=self._connection(node), options=options)
+                    self.log.info("Remote session created", node=node, session=driver.session_id,
+                                  attempt=attempt + 1, duration=round(time.perf_counter() - start, 3))
+                    with self._lock:
+                        self._slots[driver.session_id] = (driver, lock_file)
+                    return driver
+                except (WebDriverException, HTTPError) as e:
+                    last_error = e
+                    delay = self.retry_backoff * (2 ** attempt)
+                    self.log.warning("Remote session creation failed", node=node, attempt=attempt + 1,
+                                     retry_in=delay, error=str(e).strip())
+                    if attempt + 1 < self.session_retries:
+                        time.sleep(delay)
+            raise last_error
+        except BaseException:
+            # Any failure (including bad options) must give the node slot back
+            self._release_slot(lock_file)
+            raise
+
+    def release(self, driver):
+        """
+        Quits the remote session and frees its node slot
+
+        Args:
+            driver: WebDriver instance created by create_driver
+        """
+        with self._lock:
+            _, lock_file = self._slots.pop(driver.session_id, (None, None))
+        try:
+            driver.quit()
+        finally:
+            if lock_file:
+                self._release_slot(lock_file)
+
+    def close(self):
+        """
+        Quits sessions that were never released, logs command latencies and closes
+        all node connections
+        """
+        with self._lock:
+            leftovers = [driver for driver, _ in self._slots.values()]
+        for driver in leftovers:
+            self.log.warning("Quitting unreleased remote session", session=driver.session_id)
+            try:
+                self.release(driver)
+            except Exception as e:
+                # The slot is already free; the node reaps the session on its own timeout
+                self.log.warning("Failed to quit remote session", session=driver.session_id, error=str(e))
+
+        with self._lock:
+            connections = dict(self._connections)
+            self._connections.clear()
+        for node, connection in connections.items():
+            self.log.info("Remote command latencies", node=node, commands=connection.latency_summary())
+            connection.shutdown()
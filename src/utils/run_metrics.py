@@ -0,0 +1,330 @@
+import glob
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.config.config import METRICS
+from src.utils.event_logger import get_logger
+
+
+COUNTERS = {
+    'started': "Tests started",
+    'passed': "Tests passed",
+    'failed': "Tests failed",
+    'skipped': "Tests skipped",
+    'rerun': "Test attempts rerun after a failure"
+}
+
+
+class RunMetrics:
+    """
+    Live counters, duration histograms and gauges of one pytest process.
+
+    Each process (xdist worker or a plain pytest run) periodically writes a JSON
+    snapshot to a shared directory; the controller merges all snapshots into
+    Prometheus text format.
+    """
+
+    def __init__(self, worker, snapshot_dir, buckets, interval=2.0):
+        """
+        RunMetrics constructor
+
+        Args:
+            worker: Worker id (e.g. 'gw0', or 'main' without xdist)
+            snapshot_dir: Directory shared by all workers of the run
+            buckets: Upper bounds of the duration histogram in seconds
+            interval: Seconds between snapshot writes
+        """
+        self.worker = worker
+        self.snapshot_path = os.path.join(snapshot_dir, f"{worker}.json")
+        self.buckets = list(buckets)
+        self.interval = interval
+        self.counters = {name: {} for name in COUNTERS}
+        self.durations = {}
+        self.active_browsers = 0
+        self.last_activity = time.time()
+        self.gauge_sources = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def increment(self, counter, browser):
+        with self._lock:
+            values = self.counters[counter]
+            values[browser] = values.get(browser, 0) + 1
+            self.last_activity = time.time()
+
+    def observe_duration(self, browser, seconds):
+        """
+        Adds a test duration to the browser's histogram
+        """
+        with self._lock:
+            histogram = self.durations.setdefault(browser, {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0})
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram['buckets'][i] += 1
+                    break
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+
+    def record_report(self, report, browser):
+        """
+        Counts one pytest phase report. A test is counted once: by its call phase, or by
+        its setup phase when setup did not pass (fixture error or skip). Reruns are
+        counted separately from the final outcome.
+
+        Args:
+            report: pytest TestReport
+            browser: Browser the test ran with ('none' for tests without a driver)
+        """
+        # Under xdist the controller receives worker reports too; workers already counted them
+        if getattr(report, "node", None) is not None:
+            return
+        if report.when == "call":
+            self.observe_duration(browser, report.duration)
+        if report.outcome == "rerun":
+            self.increment('rerun', browser)
+        elif report.when == "call" or (report.when == "setup" and not report.passed):
+            self.increment(report.outcome, browser)
+
+    def browser_started(self):
+        with self._lock:
+            self.active_browsers += 1
+            self.last_activity = time.time()
+
+    def browser_stopped(self):
+        with self._lock:
+            self.active_browsers = max(self.active_browsers - 1, 0)
+            self.last_activity = time.time()
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: JSON serializable state of this worker
+        """
+        gauges = {name: source() for name, source in self.gauge_sources.items()}
+        with self._lock:
+            gauges['active_browsers'] = self.active_browsers
+            return {
+                'worker': self.worker,
+                'updated': time.time(),
+                'last_activity': self.last_activity,
+                'buckets': self.buckets,
+                'counters': json.loads(json.dumps(self.counters)),
+                'durations': json.loads(json.dumps(self.durations)),
+                'gauges': gauges
+            }
+
+    def write_snapshot(self):
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        temporary = f"{self.snapshot_path}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(self.snapshot(), f)
+        # Atomic replace so the controller never reads a partial file
+        os.replace(temporary, self.snapshot_path)
+
+    def start(self):
+        """
+        Starts writing snapshots every interval
+        """
+        self._thread = threading.Thread(target=self._snapshot_loop, name="run-metrics", daemon=True)
+        self._thread.start()
+
+    def _snapshot_loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.write_snapshot()
+            except OSError as e:
+                get_logger().warning("Failed to write metrics snapshot", error=str(e))
+
+    def stop(self):
+        """
+        Stops the background thread and writes a final snapshot
+        """
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.write_snapshot()
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def render_prometheus(snapshots):
+    """
+    Merges worker snapshots into the Prometheus text exposition format
+
+    Args:
+        snapshots: List of RunMetrics.snapshot() dicts
+
+    Returns:
+        str: Metrics text
+    """
+    lines = []
+    for counter, description in COUNTERS.items():
+        name = f"ui_tests_{counter}_total"
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+        for snapshot in snapshots:
+            for browser, value in sorted(snapshot['counters'].get(counter, {}).items()):
+                lines.append(f"{name}{_labels(worker=snapshot['worker'], browser=browser)} {value}")
+
+    name = "ui_test_duration_seconds"
+    lines += [f"# HELP {name} Duration of the test call phase", f"# TYPE {name} histogram"]
+    for snapshot in snapshots:
+        for browser, histogram in sorted(snapshot['durations'].items()):
+            cumulative = 0
+            for bound, count in zip(snapshot['buckets'], histogram['buckets']):
+                cumulative += count
+                labels = _labels(worker=snapshot['worker'], browser=browser, le=bound)
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _labels(worker=snapshot['worker'], browser=browser, le="+Inf")
+            lines.append(f"{name}_bucket{labels} {histogram['count']}")
+            labels = _labels(worker=snapshot['worker'], browser=browser)
+            lines.append(f"{name}_sum{labels} {histogram['sum']:.3f}")
+            lines.append(f"{name}_count{labels} {histogram['count']}")
+
+    gauges = {
+        'active_browsers': "Browsers currently open",
+        'result_sink_queue_depth': "Test results waiting to be written to MySQL"
+    }
+    for gauge, description in gauges.items():
+        name = f"ui_tests_{gauge}"
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} gauge"]
+        for snapshot in snapshots:
+            lines.append(f"{name}{_labels(worker=snapshot['worker'])} {snapshot['gauges'].get(gauge, 0)}")
+
+    name = "ui_tests_worker_last_activity_timestamp_seconds"
+    lines += [f"# HELP {name} Last test or browser event of the worker, for spotting stalled workers",
+              f"# TYPE {name} gauge"]
+    for snapshot in snapshots:
+        lines.append(f"{name}{_labels(worker=snapshot['worker'])} {snapshot['last_activity']:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def read_snapshots(snapshot_dir):
+    """
+    Returns:
+        list: Snapshots of every worker in the directory
+    """
+    snapshots = []
+    for path in sorted(glob.glob(os.path.join(snapshot_dir, "*.json"))):
+        try:
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+class MetricsExporter:
+    """
+    Runs on the controller: serves merged worker metrics over HTTP and/or
+    refreshes a node_exporter textfile.
+    """
+
+    def __init__(self, snapshot_dir, port=None, textfile=None, interval=2.0, host="127.0.0.1"):
+        self.snapshot_dir = snapshot_dir
+        self.host = host
+        self.port = port
+        self.textfile = textfile
+        self.interval = interval
+        self.log = get_logger()
+        self._server = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def render(self):
+        return render_prometheus(read_snapshots(self.snapshot_dir))
+
+    def start(self):
+        """
+        Clears snapshots of previous runs and starts the endpoint and textfile writer
+        """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(self.snapshot_dir, "*.json")):
+            os.remove(path)
+
+        if self.port:
+            exporter = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = exporter.render().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            try:
+                self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+                threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+                self.log.info("Metrics endpoint started", url=f"http://{self.host}:{self.port}/metrics")
+            except OSError as e:
+                self.log.warning("Metrics endpoint not started", host=self.host, port=self.port, error=str(e))
+
+        if self.textfile:
+            self._thread = threading.Thread(target=self._textfile_loop, name="metrics-textfile", daemon=True)
+            self._thread.start()
+
+    def write_textfile(self):
+        directory = os.path.dirname(self.textfile)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.textfile}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(self.render())
+        os.replace(temporary, self.textfile)
+
+    def _textfile_loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.write_textfile()
+            except OSError as e:
+                self.log.warning("Failed to write metrics textfile", error=str(e))
+
+    def stop(self):
+        """
+        Writes the final textfile and shuts the endpoint down
+        """
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self.textfile:
+            self.write_textfile()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """
+    Returns the RunMetrics of this process, creating it from METRICS on first use.
+
+    Returns:
+        RunMetrics: shared metrics instance
+    """
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = RunMetrics(
+                    worker=os.environ.get("PYTEST_XDIST_WORKER", "main"),
+                    snapshot_dir=METRICS['worker_dir'],
+                    buckets=METRICS['duration_buckets'],
+                    interval=METRICS['interval']
+                )
+    return _metrics